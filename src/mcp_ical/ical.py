@@ -1,8 +1,11 @@
 import sys
+from collections.abc import Iterable, Iterator
 from datetime import datetime, timedelta, timezone
+from itertools import islice
 from threading import Semaphore
 from typing import Any
 
+import objc  # type: ignore
 from EventKit import (
     EKAlarm,  # type: ignore
     EKCalendar,  # type: ignore
@@ -27,6 +30,10 @@ logger.add(
     level="DEBUG",
 )
 
+# Number of events converted per autorelease pool when listing, bounding the autoreleased
+# NSString/NSDate objects that pile up during a long traversal
+_AUTORELEASE_POOL_CHUNK_SIZE = 500
+
 
 class CalendarManager:
     def __init__(self):
@@ -60,6 +67,29 @@ class CalendarManager:
         Returns:
             list[Event]: A list of events within the date range
         """
+        return list(self.iter_events(start_time, end_time, calendar_name))
+
+    def iter_events(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        calendar_name: str | None = None,
+    ) -> Iterator[Event]:
+        """Iterate over the events within a given date range without building a list of them
+
+        Events are converted in chunks of _AUTORELEASE_POOL_CHUNK_SIZE as the iterator advances.
+
+        Args:
+            start_time: The start time of the date range
+            end_time: The end time of the date range
+            calendar_name: The name of the calendar to filter by
+
+        Returns:
+            Iterator[Event]: The events within the date range
+
+        Raises:
+            NoSuchCalendarException: If the requested calendar doesn't exist
+        """
         # only list events in a particular calendar if specified, otherwise search across all calendars
         calendar = self._find_calendar_by_name(calendar_name) if calendar_name else None
         if calendar_name and not calendar:
@@ -74,7 +104,7 @@ class CalendarManager:
         predicate = self.event_store.predicateForEventsWithStartDate_endDate_calendars_(start_time, end_time, calendars)
 
         events = self.event_store.eventsMatchingPredicate_(predicate)
-        return [Event.from_ekevent(event) for event in events]
+        return self._convert_events(events)
 
     def create_event(self, new_event: CreateEventRequest) -> Event:
         """Create a new calendar event
@@ -85,55 +115,59 @@ class CalendarManager:
         Returns:
             Event | None: The created event with identifier if successful, None if failed
         """
-        ekevent = EKEvent.eventWithEventStore_(self.event_store)
+        ekevent = self._build_ekevent(new_event)
 
-        ekevent.setTitle_(new_event.title)
-        ekevent.setStartDate_(new_event.start_time)
-        ekevent.setEndDate_(new_event.end_time)
+        try:
+            success, error = self.event_store.saveEvent_span_error_(ekevent, EKSpanThisEvent, None)
 
-        if new_event.notes:
-            ekevent.setNotes_(new_event.notes)
-        if new_event.location:
-            ekevent.setLocation_(new_event.location)
-        if new_event.url:
-            ekevent.setURL_(new_event.url)
-        if new_event.all_day:
-            ekevent.setAllDay_(new_event.all_day)
+            if not success:
+                logger.error(f"Failed to save event: {error}")
+                raise Exception(error)
 
-        if new_event.alarms_minutes_offsets:
-            for minutes in new_event.alarms_minutes_offsets:
-                # actual_minutes = minutes + (9 * 60) if new_event.all_day else minutes
-                alarm = EKAlarm.alarmWithRelativeOffset_(-60 * minutes)
-                ekevent.addAlarm_(alarm)
+            logger.info(f"Successfully created event: {new_event.title}")
+            return Event.from_ekevent(ekevent, refresh=True)
 
-        if new_event.recurrence_rule:
-            ekevent.setRecurrenceRule_(new_event.recurrence_rule.to_ek_recurrence())
+        except Exception as e:
+            logger.exception(e)
+            raise
 
-        if new_event.calendar_name:
-            calendar = self._find_calendar_by_name(new_event.calendar_name)
-            if not calendar:
-                logger.error(
-                    f"Failed to create event: The specified calendar '{new_event.calendar_name}' does not exist."
-                )
-                raise NoSuchCalendarException(new_event.calendar_name)
-        else:
-            calendar = self.event_store.defaultCalendarForNewEvents()
-            logger.debug(f"Using default calendar, {calendar}, for new event")
+    def create_events(self, new_events: list[CreateEventRequest]) -> list[Event]:
+        """Create several calendar events, committing them to the store in a single transaction
 
-        ekevent.setCalendar_(calendar)
+        Args:
+            new_events: The events to create
+
+        Returns:
+            list[Event]: The created events with identifiers, in the order they were requested
+
+        Raises:
+            NoSuchCalendarException: If any of the requested calendars doesn't exist
+            Exception: If saving or committing the events failed, in which case none of them are kept
+        """
+        ekevents = [self._build_ekevent(new_event) for new_event in new_events]
 
         try:
-            success, error = self.event_store.saveEvent_span_error_(ekevent, EKSpanThisEvent, None)
+            # Stage every event without committing so EventKit only writes (and re-indexes) once
+            for ekevent in ekevents:
+                success, error = self.event_store.saveEvent_span_commit_error_(ekevent, EKSpanThisEvent, False, None)
+
+                if not success:
+                    logger.error(f"Failed to save event: {error}")
+                    raise Exception(error)
+
+            success, error = self.event_store.commit_(None)
 
             if not success:
-                logger.error(f"Failed to save event: {error}")
+                logger.error(f"Failed to commit events: {error}")
                 raise Exception(error)
 
-            logger.info(f"Successfully created event: {new_event.title}")
-            return Event.from_ekevent(ekevent)
+            logger.info(f"Successfully created {len(ekevents)} events")
+            return [Event.from_ekevent(ekevent, refresh=True) for ekevent in ekevents]
 
         except Exception as e:
             logger.exception(e)
+            # Discard whatever was staged so a failed batch doesn't leave partial changes behind
+            self.event_store.reset()
             raise
 
     def update_event(
@@ -164,20 +198,18 @@ class CalendarManager:
         """
         # If updating a specific occurrence, find it; otherwise find the master event
         if occurrence_date:
-            existing_event = self.find_event_occurrence(event_id, occurrence_date)
-            if not existing_event:
+            existing_ek_event = self._find_ekevent_occurrence(event_id, occurrence_date)
+            if not existing_ek_event:
                 raise NoSuchEventException(
                     f"{event_id} at {occurrence_date.isoformat()} - occurrence not found"
                 )
             logger.info(f"Found occurrence for update at {occurrence_date.isoformat()}")
         else:
-            existing_event = self.find_event_by_id(event_id)
-            if not existing_event:
+            existing_ek_event = self._find_ekevent_by_id(event_id)
+            if not existing_ek_event:
                 raise NoSuchEventException(event_id)
 
-        existing_ek_event = existing_event._raw_event
-        if not existing_ek_event:
-            raise NoSuchEventException(event_id)
+        existing_title = existing_ek_event.title()
 
         if request.title is not None:
             existing_ek_event.setTitle_(request.title)
@@ -242,8 +274,8 @@ class CalendarManager:
             else:
                 scope = "all occurrences"
 
-            logger.info(f"Successfully updated {scope}: {request.title or existing_event.title}")
-            return Event.from_ekevent(existing_ek_event)
+            logger.info(f"Successfully updated {scope}: {request.title or existing_title}")
+            return Event.from_ekevent(existing_ek_event, refresh=True)
 
         except Exception as e:
             logger.error(f"Failed to update event: {e}")
@@ -277,17 +309,15 @@ class CalendarManager:
         """
         # If occurrence_date is provided, find the specific occurrence
         if occurrence_date:
-            existing_event = self.find_event_occurrence(event_id, occurrence_date)
-            if not existing_event:
+            existing_ek_event = self._find_ekevent_occurrence(event_id, occurrence_date)
+            if not existing_ek_event:
                 raise NoSuchEventException(f"{event_id} at {occurrence_date.isoformat()}")
         else:
-            existing_event = self.find_event_by_id(event_id)
-            if not existing_event:
+            existing_ek_event = self._find_ekevent_by_id(event_id)
+            if not existing_ek_event:
                 raise NoSuchEventException(event_id)
 
-        existing_ek_event = existing_event._raw_event
-        if not existing_ek_event:
-            raise NoSuchEventException(event_id)
+        existing_title = existing_ek_event.title()
 
         try:
             # Use EKSpanFutureEvents to delete all future occurrences, or EKSpanThisEvent for just this one
@@ -308,7 +338,7 @@ class CalendarManager:
             else:
                 scope = "event"
 
-            logger.info(f"Successfully deleted: {existing_event.title} {scope}")
+            logger.info(f"Successfully deleted: {existing_title} {scope}")
             return True
 
         except Exception as e:
@@ -324,12 +354,8 @@ class CalendarManager:
         Returns:
             Event | None: The event if found, None otherwise
         """
-        ekevent = self.event_store.eventWithIdentifier_(identifier)
-        if not ekevent:
-            logger.info(f"No event found with ID: {identifier}")
-            return None
-
-        return Event.from_ekevent(ekevent)
+        ekevent = self._find_ekevent_by_id(identifier)
+        return Event.from_ekevent(ekevent) if ekevent else None
 
     def find_event_occurrence(self, event_id: str, occurrence_date: datetime) -> Event | None:
         """Find a specific occurrence of a recurring event.
@@ -344,42 +370,8 @@ class CalendarManager:
         Returns:
             The matching occurrence, or None if not found
         """
-        result = self._search_occurrence_by_datetime(event_id, occurrence_date)
-        if result:
-            return result
-
-        # If naive datetime, try UTC interpretation (common when Claude constructs local times)
-        if occurrence_date.tzinfo is None:
-            logger.info(f"No match for {event_id}, trying UTC interpretation of {occurrence_date}")
-            utc_datetime = occurrence_date.replace(tzinfo=timezone.utc)
-            result = self._search_occurrence_by_datetime(event_id, utc_datetime)
-            if result:
-                logger.info(f"Found match using UTC interpretation")
-                return result
-
-        logger.info(f"No occurrence found for {event_id} at {occurrence_date}")
-        return None
-
-    def _search_occurrence_by_datetime(self, event_id: str, target_datetime: datetime) -> Event | None:
-        """Search for occurrence by datetime.
-
-        Uses a minimal ±1 minute search window (required by EventKit's predicate API),
-        then does exact datetime matching with ==.
-        """
-        search_start = target_datetime - timedelta(minutes=1)
-        search_end = target_datetime + timedelta(minutes=1)
-
-        predicate = self.event_store.predicateForEventsWithStartDate_endDate_calendars_(
-            search_start, search_end, None
-        )
-        events = self.event_store.eventsMatchingPredicate_(predicate)
-
-        for ekevent in events:
-            if ekevent.eventIdentifier() == event_id and ekevent.startDate() == target_datetime:
-                logger.debug(f"Found occurrence for {event_id} at {target_datetime}")
-                return Event.from_ekevent(ekevent)
-
-        return None
+        ekevent = self._find_ekevent_occurrence(event_id, occurrence_date)
+        return Event.from_ekevent(ekevent) if ekevent else None
 
     def list_calendar_names(self) -> list[str]:
         """List all available calendar names
@@ -446,6 +438,136 @@ class CalendarManager:
         logger.info(f"Calendar '{calendar_name}' not found")
         return None
 
+    def _find_ekevent_by_id(self, identifier: str) -> EKEvent | None:
+        """Fetch the live EKEvent for an identifier, as needed to modify or remove it
+
+        Args:
+            identifier: The unique identifier of the event
+
+        Returns:
+            EKEvent | None: The event if found, None otherwise
+        """
+        ekevent = self.event_store.eventWithIdentifier_(identifier)
+        if not ekevent:
+            logger.info(f"No event found with ID: {identifier}")
+            return None
+
+        return ekevent
+
+    def _find_ekevent_occurrence(self, event_id: str, occurrence_date: datetime) -> EKEvent | None:
+        """Fetch the live EKEvent for a specific occurrence of a recurring event.
+
+        If the datetime has no timezone, tries both as-provided and UTC interpretations.
+
+        Args:
+            event_id: The event identifier
+            occurrence_date: Start time of the occurrence
+
+        Returns:
+            EKEvent | None: The matching occurrence, or None if not found
+        """
+        result = self._search_occurrence_by_datetime(event_id, occurrence_date)
+        if result:
+            return result
+
+        # If naive datetime, try UTC interpretation (common when Claude constructs local times)
+        if occurrence_date.tzinfo is None:
+            logger.info(f"No match for {event_id}, trying UTC interpretation of {occurrence_date}")
+            utc_datetime = occurrence_date.replace(tzinfo=timezone.utc)
+            result = self._search_occurrence_by_datetime(event_id, utc_datetime)
+            if result:
+                logger.info(f"Found match using UTC interpretation")
+                return result
+
+        logger.info(f"No occurrence found for {event_id} at {occurrence_date}")
+        return None
+
+    def _search_occurrence_by_datetime(self, event_id: str, target_datetime: datetime) -> EKEvent | None:
+        """Search for occurrence by datetime.
+
+        Uses a minimal ±1 minute search window (required by EventKit's predicate API),
+        then does exact datetime matching with ==.
+        """
+        search_start = target_datetime - timedelta(minutes=1)
+        search_end = target_datetime + timedelta(minutes=1)
+
+        predicate = self.event_store.predicateForEventsWithStartDate_endDate_calendars_(
+            search_start, search_end, None
+        )
+        events = self.event_store.eventsMatchingPredicate_(predicate)
+
+        for ekevent in events:
+            if ekevent.eventIdentifier() == event_id and ekevent.startDate() == target_datetime:
+                logger.debug(f"Found occurrence for {event_id} at {target_datetime}")
+                return ekevent
+
+        return None
+
+    def _convert_events(self, ekevents: Iterable[EKEvent]) -> Iterator[Event]:
+        """Convert EKEvents to Events in chunks, draining an autorelease pool after each chunk.
+
+        The pool is exited before a chunk is yielded so it is never left open across a suspended generator.
+        """
+        ekevents = iter(ekevents)
+        while True:
+            with objc.autorelease_pool():
+                chunk = [Event.from_ekevent(ekevent) for ekevent in islice(ekevents, _AUTORELEASE_POOL_CHUNK_SIZE)]
+
+            if not chunk:
+                return
+
+            yield from chunk
+
+    def _build_ekevent(self, new_event: CreateEventRequest) -> EKEvent:
+        """Build an unsaved EKEvent from a create request
+
+        Args:
+            new_event: The event to build
+
+        Returns:
+            EKEvent: The populated event, not yet saved to the event store
+
+        Raises:
+            NoSuchCalendarException: If the requested calendar doesn't exist
+        """
+        ekevent = EKEvent.eventWithEventStore_(self.event_store)
+
+        ekevent.setTitle_(new_event.title)
+        ekevent.setStartDate_(new_event.start_time)
+        ekevent.setEndDate_(new_event.end_time)
+
+        if new_event.notes:
+            ekevent.setNotes_(new_event.notes)
+        if new_event.location:
+            ekevent.setLocation_(new_event.location)
+        if new_event.url:
+            ekevent.setURL_(new_event.url)
+        if new_event.all_day:
+            ekevent.setAllDay_(new_event.all_day)
+
+        if new_event.alarms_minutes_offsets:
+            for minutes in new_event.alarms_minutes_offsets:
+                # actual_minutes = minutes + (9 * 60) if new_event.all_day else minutes
+                alarm = EKAlarm.alarmWithRelativeOffset_(-60 * minutes)
+                ekevent.addAlarm_(alarm)
+
+        if new_event.recurrence_rule:
+            ekevent.setRecurrenceRule_(new_event.recurrence_rule.to_ek_recurrence())
+
+        if new_event.calendar_name:
+            calendar = self._find_calendar_by_name(new_event.calendar_name)
+            if not calendar:
+                logger.error(
+                    f"Failed to create event: The specified calendar '{new_event.calendar_name}' does not exist."
+                )
+                raise NoSuchCalendarException(new_event.calendar_name)
+        else:
+            calendar = self.event_store.defaultCalendarForNewEvents()
+            logger.debug(f"Using default calendar, {calendar}, for new event")
+
+        ekevent.setCalendar_(calendar)
+        return ekevent
+
     def _create_calendar(self, calendar_name: str, source_name: str = "iCloud") -> Any | None:
         """Create a new calendar with the specified name.
 
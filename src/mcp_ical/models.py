@@ -1,7 +1,8 @@
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime
 from enum import IntEnum
-from typing import Annotated, Self
+from typing import Annotated, Any, Self
 
 from EventKit import (
     EKEvent,  # type: ignore[import-untyped]
@@ -9,6 +10,7 @@ from EventKit import (
     EKRecurrenceEnd,  # type: ignore[import-untyped]
     EKRecurrenceRule,  # type: ignore[import-untyped]
 )
+from Foundation import NSNull  # type: ignore[import-untyped]
 from pydantic import BaseModel, BeforeValidator, Field, model_validator
 
 
@@ -29,13 +31,70 @@ class Weekday(IntEnum):
     SATURDAY = 7
 
 
+# Plain int -> name lookup for formatting, avoiding the enum name descriptor on every event
+_FREQUENCY_NAMES = {frequency.value: frequency.name for frequency in Frequency}
+
+
+# "Any week" EKRecurrenceDayOfWeek instances, created on first use and shared by every recurrence rule
+_EK_DAYS_OF_WEEK: dict[Weekday, EKRecurrenceDayOfWeek] = {}
+
+
+def _ek_day_of_week(day: Weekday) -> EKRecurrenceDayOfWeek:
+    """Return the cached EKRecurrenceDayOfWeek for a weekday, allocating it on first use."""
+    ek_day = _EK_DAYS_OF_WEEK.get(day)
+    if ek_day is None:
+        ek_day = EKRecurrenceDayOfWeek.alloc().initWithDayOfTheWeek_weekNumber_(
+            day.value,
+            0,  # weekNumber 0 means "any week"
+        )
+        _EK_DAYS_OF_WEEK[day] = ek_day
+    return ek_day
+
+
+def _nsdate_to_local(nsdate) -> datetime:
+    """Convert an NSDate straight to a naive local datetime, skipping the generic validator checks."""
+    return datetime.fromtimestamp(nsdate.timeIntervalSince1970())
+
+
+# Scalar EKEvent attributes fetched through KVC as a single dictionary and then a single array of values
+_EKEVENT_KEYS = [
+    "title",
+    "startDate",
+    "endDate",
+    "location",
+    "notes",
+    "URL",
+    "allDay",
+    "availability",
+    "status",
+    "eventIdentifier",
+    "lastModifiedDate",
+    "calendar",
+]
+
+# KVC reports nil attributes as the NSNull singleton, also used as the not-found marker below
+_NSNULL = NSNull.null()
+
+
+def _ekevent_values(ekevent: EKEvent) -> dict[str, Any]:
+    """Gather the scalar attributes of an EKEvent via KVC, mapping NSNull back to None."""
+    values = ekevent.dictionaryWithValuesForKeys_(_EKEVENT_KEYS)
+    # Pull every value out in one objectsForKeys_ call rather than one objectForKey_ crossing per key
+    objects = values.objectsForKeys_notFoundMarker_(_EKEVENT_KEYS, _NSNULL)
+    return {key: None if value is _NSNULL else value for key, value in zip(_EKEVENT_KEYS, objects)}
+
+
 def convert_datetime(v):
-    if hasattr(v, "timeIntervalSince1970"):
-        return datetime.fromtimestamp(v.timeIntervalSince1970())
+    # Fast path for the common case, a plain datetime that needs no conversion
+    if type(v) is datetime:
+        return v
 
     if isinstance(v, str):
         return datetime.fromisoformat(v)
 
+    if hasattr(v, "timeIntervalSince1970"):
+        return _nsdate_to_local(v)
+
     if isinstance(v, datetime):
         return v
 
@@ -72,13 +131,7 @@ class RecurrenceRule(BaseModel):
         # Convert weekdays if specified
         ek_days = None
         if self.days_of_week:
-            ek_days = [
-                EKRecurrenceDayOfWeek.alloc().initWithDayOfTheWeek_weekNumber_(
-                    day.value,
-                    0,  # weekNumber 0 means "any week"
-                )
-                for day in self.days_of_week
-            ]
+            ek_days = [_ek_day_of_week(day) for day in self.days_of_week]
 
         return EKRecurrenceRule.alloc().initRecurrenceWithFrequency_interval_daysOfTheWeek_daysOfTheMonth_monthsOfTheYear_weeksOfTheYear_daysOfTheYear_setPositions_end_(
             self.frequency.value,
@@ -93,7 +146,94 @@ class RecurrenceRule(BaseModel):
         )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
+class _EKEventDetails:
+    """Attributes of an EKEvent that each cost extra bridge calls to read.
+
+    Everything here is independent of the local timezone and of the calendar's title, so it can be cached
+    per event version; dates are kept as timestamps and converted to local time on every read.
+    """
+
+    attendees: list[str]
+    alarms_minutes_offsets: list[int]
+    has_alarms: bool
+    organizer: str | None
+    recurrence_frequency: Frequency | None = None
+    recurrence_interval: int = 1
+    recurrence_days_of_week: list[Weekday] | None = None
+    recurrence_end_timestamp: float | None = None
+    recurrence_occurrence_count: int | None = None
+
+    @classmethod
+    def from_ekevent(cls, ekevent: EKEvent) -> "_EKEventDetails":
+        """Read the list-valued and nested attributes of an EKEvent."""
+        # Most events have neither attendees nor alarms, so check the cheap flags before fetching the lists
+        attendees = [str(attendee.name()) for attendee in ekevent.attendees()] if ekevent.hasAttendees() else []
+
+        # Convert EKAlarms to minute offsets
+        alarms = []
+        has_alarms = bool(ekevent.hasAlarms())
+        if has_alarms:
+            for alarm in ekevent.alarms() or []:
+                offset_seconds = alarm.relativeOffset()
+                minutes = int(-offset_seconds / 60)  # Convert to minutes
+                alarms.append(minutes)
+
+        organizer = ekevent.organizer()
+        details = {
+            "attendees": attendees,
+            "alarms_minutes_offsets": alarms,
+            "has_alarms": has_alarms,
+            "organizer": str(organizer.name()) if organizer else None,
+        }
+
+        rule = ekevent.recurrenceRule()
+        if rule:
+            # Read each bridged attribute once rather than per use
+            recurrence_end = rule.recurrenceEnd()
+            occurrence_count = recurrence_end.occurrenceCount() if recurrence_end else 0
+            ek_days = rule.daysOfTheWeek()
+            details.update(
+                recurrence_frequency=Frequency(rule.frequency()),
+                recurrence_interval=rule.interval(),
+                recurrence_days_of_week=[Weekday(day.dayOfTheWeek()) for day in ek_days] if ek_days else None,
+                # Only set one of end_date or occurrence_count
+                recurrence_end_timestamp=recurrence_end.endDate().timeIntervalSince1970()
+                if recurrence_end and not occurrence_count
+                else None,
+                recurrence_occurrence_count=occurrence_count or None,
+            )
+
+        return cls(**details)
+
+    def recurrence_rule(self) -> RecurrenceRule | None:
+        """Build the RecurrenceRule mirror, converting the end date to the current local time."""
+        if self.recurrence_frequency is None:
+            return None
+
+        # EventKit rules are valid by construction, so skip the pydantic validators
+        return RecurrenceRule.model_construct(
+            frequency=self.recurrence_frequency,
+            interval=self.recurrence_interval,
+            days_of_week=list(self.recurrence_days_of_week) if self.recurrence_days_of_week else None,
+            end_date=datetime.fromtimestamp(self.recurrence_end_timestamp)
+            if self.recurrence_end_timestamp is not None
+            else None,
+            occurrence_count=self.recurrence_occurrence_count,
+        )
+
+
+# Event details keyed by (eventIdentifier, lastModifiedDate, startDate) so that unchanged events returned by
+# repeated or overlapping list_events queries skip the attendee, alarm, organizer and recurrence bridge calls.
+# The start date is part of the key because every occurrence of a recurring series shares the same identifier
+# and modification date. Scalar attributes, local times and the calendar title are read fresh on every
+# conversion, so timezone changes and calendar renames are never served stale. Listings stream Events out
+# without keeping them, but each one still leaves its details here, bounded by _EVENT_CACHE_MAX_SIZE entries.
+_EVENT_CACHE_MAX_SIZE = 10_000
+_event_cache: OrderedDict[tuple[str, float, float], _EKEventDetails] = OrderedDict()
+
+
+@dataclass(slots=True)
 class Event:
     title: str
     start_time: FlexibleDateTime
@@ -112,60 +252,61 @@ class Event:
     attendees: list[str] | None = None
     last_modified: FlexibleDateTime | None = None
     recurrence_rule: RecurrenceRule | None = None
-    _raw_event: EKEvent | None = None  # Store the original EKEvent object
 
     @classmethod
-    def from_ekevent(cls, ekevent: EKEvent) -> "Event":
-        """Create an Event instance from an EKEvent."""
-        attendees = [str(attendee.name()) for attendee in ekevent.attendees()] if ekevent.attendees() else []
-
-        # Convert EKAlarms to our Alarm objects
-        alarms = []
-        if ekevent.alarms():
-            for alarm in ekevent.alarms():
-                offset_seconds = alarm.relativeOffset()
-                minutes = int(-offset_seconds / 60)  # Convert to minutes
-                alarms.append(minutes)
-
-        # Convert EKRecurrenceRule to our Recurrence object
-        recurrence = None
-        if ekevent.recurrenceRule():
-            rule = ekevent.recurrenceRule()
-            days = None
-            if rule.daysOfTheWeek():
-                days = [Weekday(day.dayOfTheWeek()) for day in rule.daysOfTheWeek()]
-
-            recurrence = RecurrenceRule(
-                frequency=Frequency(rule.frequency()),
-                interval=rule.interval(),
-                days_of_week=days,
-                # Only set one of end_date or occurrence_count
-                end_date=rule.recurrenceEnd().endDate()
-                if rule.recurrenceEnd() and not rule.recurrenceEnd().occurrenceCount()
-                else None,
-                occurrence_count=rule.recurrenceEnd().occurrenceCount()
-                if rule.recurrenceEnd() and rule.recurrenceEnd().occurrenceCount()
-                else None,
-            )
+    def from_ekevent(cls, ekevent: EKEvent, refresh: bool = False) -> "Event":
+        """Create an Event instance from an EKEvent.
+
+        Args:
+            ekevent: The EKEvent to convert
+            refresh: Skip the conversion cache lookup, e.g. for an EKEvent that was just modified in place
+        """
+        values = _ekevent_values(ekevent)
+        identifier = values["eventIdentifier"]
+        start_date = values["startDate"]
+        last_modified = values["lastModifiedDate"]
+
+        # Read each timestamp once and reuse it for both the cache key and the local datetime
+        start_ts = start_date.timeIntervalSince1970()
+        modified_ts = last_modified.timeIntervalSince1970() if last_modified else None
+
+        details = None
+        cache_key = None
+        if identifier and modified_ts is not None:
+            cache_key = (identifier, modified_ts, start_ts)
+            if not refresh:
+                details = _event_cache.get(cache_key)
+
+        if details is None:
+            details = _EKEventDetails.from_ekevent(ekevent)
+            if cache_key is not None:
+                _event_cache[cache_key] = details
+                _event_cache.move_to_end(cache_key)
+                if len(_event_cache) > _EVENT_CACHE_MAX_SIZE:
+                    _event_cache.popitem(last=False)
+        else:
+            _event_cache.move_to_end(cache_key)
+
+        calendar = values["calendar"]
 
         return cls(
-            title=ekevent.title(),
-            start_time=ekevent.startDate(),
-            end_time=ekevent.endDate(),
-            calendar_name=ekevent.calendar().title(),
-            location=ekevent.location(),
-            notes=ekevent.notes(),
-            url=str(ekevent.URL()) if ekevent.URL() else None,
-            all_day=ekevent.isAllDay(),
-            alarms_minutes_offsets=alarms,
-            recurrence_rule=recurrence,
-            availability=ekevent.availability(),
-            status=ekevent.status(),
-            organizer=str(ekevent.organizer().name()) if ekevent.organizer() else None,
-            attendees=attendees,
-            last_modified=ekevent.lastModifiedDate(),
-            identifier=ekevent.eventIdentifier(),
-            _raw_event=ekevent,
+            title=values["title"],
+            start_time=datetime.fromtimestamp(start_ts),
+            end_time=_nsdate_to_local(values["endDate"]),
+            calendar_name=calendar.title() if calendar is not None else None,
+            location=values["location"],
+            notes=values["notes"],
+            url=str(values["URL"]) if values["URL"] else None,
+            all_day=bool(values["allDay"]),
+            has_alarms=details.has_alarms,
+            alarms_minutes_offsets=list(details.alarms_minutes_offsets),
+            recurrence_rule=details.recurrence_rule(),
+            availability=values["availability"],
+            status=values["status"],
+            organizer=details.organizer,
+            attendees=list(details.attendees),
+            last_modified=datetime.fromtimestamp(modified_ts) if modified_ts is not None else None,
+            identifier=identifier,
         )
 
     def __str__(self) -> str:
@@ -176,7 +317,7 @@ class Event:
         recurrence_info = "No recurrence"
         if self.recurrence_rule:
             recurrence_info = (
-                f"Recurrence: {self.recurrence_rule.frequency.name}, "
+                f"Recurrence: {_FREQUENCY_NAMES[self.recurrence_rule.frequency]}, "
                 f"Interval: {self.recurrence_rule.interval}, "
                 f"End Date: {self.recurrence_rule.end_date or 'N/A'}, "
                 f"Occurrences: {self.recurrence_rule.occurrence_count or 'N/A'}"
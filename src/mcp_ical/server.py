@@ -1,6 +1,6 @@
 import sys
 from datetime import datetime
-from functools import lru_cache
+from io import StringIO
 from textwrap import dedent
 
 from loguru import logger
@@ -19,25 +19,34 @@ logger.add(
 )
 
 
+_NO_PERMISSION_MSG = dedent("""\
+    Calendar access is not granted. Please follow these steps:
+
+    1. Open System Preferences/Settings
+    2. Go to Privacy & Security > Calendar
+    3. Check the box next to your terminal application or Claude Desktop
+    4. Restart Claude Desktop
+
+    Once you've granted access, try your calendar operation again.
+    """)
+
+
 # Initialize the CalendarManager on demand in order to only request calendar permission
 # when a calendar tool is invoked instead of on the launch of the Claude Desktop app.
-@lru_cache(maxsize=None)
+_calendar_manager: CalendarManager | None = None
+
+
 def get_calendar_manager() -> CalendarManager:
     """Get or initialize the calendar manager with proper error handling."""
+    global _calendar_manager
+    if _calendar_manager is not None:
+        return _calendar_manager
+
     try:
-        return CalendarManager()
+        _calendar_manager = CalendarManager()
+        return _calendar_manager
     except ValueError as e:
-        error_msg = dedent("""\
-        Calendar access is not granted. Please follow these steps:
-
-        1. Open System Preferences/Settings
-        2. Go to Privacy & Security > Calendar
-        3. Check the box next to your terminal application or Claude Desktop
-        4. Restart Claude Desktop
-
-        Once you've granted access, try your calendar operation again.
-        """)
-        raise ValueError(error_msg) from e
+        raise ValueError(_NO_PERMISSION_MSG) from e
 
 
 @mcp.resource("calendars://list")
@@ -85,11 +94,15 @@ async def list_events(start_date: datetime, end_date: datetime, calendar_name: s
     """
     try:
         manager = get_calendar_manager()
-        events = manager.list_events(start_date, end_date, calendar_name)
-        if not events:
+        # Stream events straight into the response rather than building the full list first
+        buf = StringIO()
+        for event in manager.iter_events(start_date, end_date, calendar_name):
+            buf.write(str(event))
+
+        if not buf.tell():
             return "No events found in the specified date range"
 
-        return "".join([str(event) for event in events])
+        return buf.getvalue()
 
     except Exception as e:
         return f"Error listing events: {str(e)}"
@@ -146,6 +159,36 @@ async def create_event(create_event_request: CreateEventRequest) -> str:
         return f"Error creating event: {str(e)}"
 
 
+@mcp.tool()
+async def create_events(create_event_requests: list[CreateEventRequest]) -> str:
+    """Create several calendar events in one go.
+
+    Prefer this over calling create_event repeatedly when the user asks for more than one event,
+    e.g. when importing a schedule. All events are committed together: if any of them fails, none are created.
+
+    Before using this tool, follow the same checks as for create_event for each of the events.
+
+    Args:
+        create_event_requests: List of events to create. Each entry takes the same fields as the
+            create_event_request argument of create_event (title, start_time, end_time, notes, location,
+            calendar_name, all_day, alarms_minutes_offsets, url, recurrence_rule).
+    """
+    logger.info(f"Incoming Create Events Request for {len(create_event_requests)} events")
+    try:
+        manager = get_calendar_manager()
+
+        events = manager.create_events(create_event_requests)
+        if not events:
+            return "No events were created."
+
+        return f"Successfully created {len(events)} events:\n" + "\n".join(
+            f"- {event.title} (ID: {event.identifier})" for event in events
+        )
+
+    except Exception as e:
+        return f"Error creating events: {str(e)}"
+
+
 @mcp.tool()
 async def update_event(
     event_id: str,
@@ -110,6 +110,88 @@ def test_create_and_get_event(calendar_manager, test_event_base, test_calendar,
     assert retrieved_event.calendar_name == test_calendar["name"]
 
 
+def test_create_events_batch(calendar_manager, test_event_base, test_calendar, cleanup_events):
+    """Test creating several events in a single commit"""
+    events = calendar_manager.create_events(
+        [
+            CreateEventRequest(
+                title=f"Batch Event {i}",
+                start_time=test_event_base["start_time"] + timedelta(hours=2 * i),
+                end_time=test_event_base["end_time"] + timedelta(hours=2 * i),
+                calendar_name=test_calendar["name"],
+            )
+            for i in range(3)
+        ]
+    )
+    for event in events:
+        cleanup_events(event.identifier)
+
+    assert [event.title for event in events] == ["Batch Event 0", "Batch Event 1", "Batch Event 2"]
+
+    # Verify all events were committed
+    for event in events:
+        retrieved_event = calendar_manager.find_event_by_id(event.identifier)
+        assert retrieved_event is not None
+        assert retrieved_event.calendar_name == test_calendar["name"]
+
+
+def test_create_events_nonexistent_calendar(calendar_manager, test_event_base, test_calendar):
+    """Test that a batch with a non-existent calendar raises NoSuchCalendarException and creates nothing"""
+    with pytest.raises(NoSuchCalendarException):
+        calendar_manager.create_events(
+            [
+                CreateEventRequest(
+                    title="Batch Event Valid",
+                    start_time=test_event_base["start_time"],
+                    end_time=test_event_base["end_time"],
+                    calendar_name=test_calendar["name"],
+                ),
+                CreateEventRequest(
+                    title="Batch Event Invalid",
+                    start_time=test_event_base["start_time"],
+                    end_time=test_event_base["end_time"],
+                    calendar_name="NonExistentCalendar",
+                ),
+            ]
+        )
+
+    events = calendar_manager.list_events(
+        start_time=test_event_base["start_time"] - timedelta(hours=1),
+        end_time=test_event_base["end_time"] + timedelta(hours=1),
+        calendar_name=test_calendar["name"],
+    )
+    assert len(events) == 0
+
+
+def test_create_events_rejected_save_discards_batch(calendar_manager, test_event_base, test_calendar):
+    """Test that an event rejected by the store discards the events staged before it"""
+    with pytest.raises(Exception):
+        calendar_manager.create_events(
+            [
+                CreateEventRequest(
+                    title="Batch Event Valid",
+                    start_time=test_event_base["start_time"],
+                    end_time=test_event_base["end_time"],
+                    calendar_name=test_calendar["name"],
+                ),
+                # EventKit refuses to save an event that ends before it starts
+                CreateEventRequest(
+                    title="Batch Event Inverted",
+                    start_time=test_event_base["end_time"],
+                    end_time=test_event_base["start_time"],
+                    calendar_name=test_calendar["name"],
+                ),
+            ]
+        )
+
+    events = calendar_manager.list_events(
+        start_time=test_event_base["start_time"] - timedelta(hours=1),
+        end_time=test_event_base["end_time"] + timedelta(hours=1),
+        calendar_name=test_calendar["name"],
+    )
+    assert len(events) == 0
+
+
 def test_list_events(calendar_manager, test_event_base, test_calendar, cleanup_events):
     """Test listing events"""
     # Create first event
@@ -150,6 +232,53 @@ def test_list_events(calendar_manager, test_event_base, test_calendar, cleanup_e
     assert event2.identifier in event_ids
 
 
+def test_list_events_after_update(calendar_manager, test_event_base, test_calendar, cleanup_events):
+    """Test that listing the same range again after an update shows the change instead of a cached result"""
+    event = calendar_manager.create_event(
+        CreateEventRequest(
+            title=test_event_base["title"],
+            start_time=test_event_base["start_time"],
+            end_time=test_event_base["end_time"],
+            location=test_event_base["location"],
+            calendar_name=test_calendar["name"],
+        )
+    )
+    cleanup_events(event.identifier)
+
+    list_range = {
+        "start_time": test_event_base["start_time"] - timedelta(hours=1),
+        "end_time": test_event_base["end_time"] + timedelta(hours=2),
+        "calendar_name": test_calendar["name"],
+    }
+
+    # List once so the event is converted (and cached) before the update
+    events_before = calendar_manager.list_events(**list_range)
+    assert len(events_before) == 1
+    assert events_before[0].title == test_event_base["title"]
+
+    new_start_time = test_event_base["start_time"] + timedelta(minutes=30)
+    new_end_time = test_event_base["end_time"] + timedelta(minutes=30)
+    calendar_manager.update_event(
+        event.identifier,
+        UpdateEventRequest(
+            title="Updated Listed Event",
+            location="Updated Location",
+            start_time=new_start_time,
+            end_time=new_end_time,
+            alarms_minutes_offsets=[15],
+        ),
+    )
+
+    # Listing the same range again must reflect the update
+    events_after = calendar_manager.list_events(**list_range)
+    assert len(events_after) == 1
+    assert events_after[0].title == "Updated Listed Event"
+    assert events_after[0].location == "Updated Location"
+    assert events_after[0].start_time == new_start_time
+    assert events_after[0].end_time == new_end_time
+    assert 15 in events_after[0].alarms_minutes_offsets
+
+
 def test_update_event(calendar_manager, test_event_base, test_calendar, cleanup_events):
     """Test updating an event"""
     # Create event